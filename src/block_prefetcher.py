@@ -0,0 +1,94 @@
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+import threading
+from connectors import ExecutionClientConnector
+
+
+# rough per transaction overhead of a decoded full transaction block (hashes, addresses, numbers)
+TRANSACTION_OVERHEAD_BYTES = 1024
+
+
+def estimate_block_size(block: dict) -> int:
+    size = TRANSACTION_OVERHEAD_BYTES
+    for transaction in block["transactions"]:
+        if isinstance(transaction, dict):
+            size += TRANSACTION_OVERHEAD_BYTES + len(transaction["input"])
+        else:
+            size += len(transaction)
+
+    return size
+
+
+class BlockPrefetcher:
+
+    def __init__(self,
+                 execution_client: ExecutionClientConnector,
+                 block_identifiers: list,
+                 window_size: int = 8,
+                 max_buffered_bytes: int = 512 * 1024 * 1024,
+                 full_transactions: bool = True
+                 ) -> None:
+        self.execution_client = execution_client
+        self.block_identifiers = block_identifiers
+        self.window_size = max(window_size, 1)
+        self.max_buffered_bytes = max_buffered_bytes
+        self.full_transactions = full_transactions
+
+        # estimated sizes of fetched but not yet consumed blocks
+        self.block_sizes = {}
+        self.block_sizes_lock = threading.Lock()
+
+    def fetch_block(self, block_identifier: int) -> dict:
+        block = self.execution_client.get_block(
+            block_identifier, self.full_transactions)
+
+        block_size = estimate_block_size(block)
+        with self.block_sizes_lock:
+            self.block_sizes[block_identifier] = block_size
+
+        return block
+
+    def get_buffered_bytes(self) -> int:
+        with self.block_sizes_lock:
+            return sum(self.block_sizes.values())
+
+    def __iter__(self):
+        """
+        Yield (block_identifier, future) in block order.
+        Up to window_size blocks are fetched ahead, new fetches are paused while
+        completed but unconsumed blocks exceed max_buffered_bytes.
+        future.result() returns the block or raises the fetch error.
+        """
+        block_identifiers = iter(self.block_identifiers)
+        pending = deque()
+
+        with ThreadPoolExecutor(max_workers=self.window_size) as executor:
+            def fill_window():
+                while len(pending) < self.window_size:
+                    # always keep at least one fetch in flight to make progress
+                    if len(pending) > 0 and self.get_buffered_bytes() >= self.max_buffered_bytes:
+                        break
+
+                    block_identifier = next(block_identifiers, None)
+                    if block_identifier is None:
+                        break
+
+                    pending.append((block_identifier, executor.submit(
+                        self.fetch_block, block_identifier)))
+
+            try:
+                fill_window()
+                while len(pending) > 0:
+                    block_identifier, future = pending.popleft()
+                    # wait for the head block, then top up the window before handing it out
+                    future.exception()
+                    with self.block_sizes_lock:
+                        self.block_sizes.pop(block_identifier, None)
+                    fill_window()
+
+                    yield block_identifier, future
+            finally:
+                for _, future in pending:
+                    future.cancel()
+                with self.block_sizes_lock:
+                    self.block_sizes.clear()
@@ -19,7 +19,32 @@ SQL_DATABASE_PASSWORD = "admin"
 SQL_DATABASE_NAME = "ethereum_api"
 SQL_DATABASE_TABLE_CONTRACT = "contract"
 SQL_DATABASE_TABLE_TRANSACTION = "transaction"
+SQL_DATABASE_TABLE_SUPPLY_REFRESH = "supply_refresh"
+SQL_DATABASE_TABLE_INDEX_CHANGE = "index_change"
+# store addresses/hashes as binary and supplies as big-endian uint256 binary
+# only for new tables, existing tables with the other schema are rejected at startup
+SQL_DATABASE_COMPACT_SCHEMA = False
+# max number of cached result rows (0 disables the cache)
+SQL_DATABASE_QUERY_CACHE_MAX_ROWS = 100000
+# log writes to the index change table for query caches of other processes (e.g. an api), off: no extra write per insert
+SQL_DATABASE_CHANGE_LOG = False
+# seconds between checks for changes written by other processes
+SQL_DATABASE_QUERY_CACHE_VERSION_TTL = 5
 
 # indexing params
 INDEXING_START_BLOCK = 16000000
 INDEXING_END_BLOCK = 17000000
+
+# columnar export
+EXPORT_OUTPUT_DIR = "src/export_data"
+EXPORT_FILE_FORMAT = "parquet"  # parquet or arrow
+EXPORT_PARTITION_SIZE = 100000  # blocks per partition
+
+# block prefetching
+BLOCK_PREFETCH_WINDOW = 8
+BLOCK_PREFETCH_MAX_BUFFERED_BYTES = 512 * 1024 * 1024
+
+# total supply refresh
+SUPPLY_REFRESH_INTERVAL = 100  # blocks per mint/burn log query and refresh
+SUPPLY_REFRESH_BATCH_SIZE = 100
+SUPPLY_REFRESH_MAX_BATCHES = 10
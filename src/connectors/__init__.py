@@ -1,4 +1,20 @@
 # __init__.py
-from .execution_client_connector import ExecutionClientConnector, TokenStandard
 from .sql_database_connector import SqlDatabaseConnector
-from .etherscan_connector import EtherscanConnector
+
+
+def __getattr__(name: str):
+    # resolved lazily to keep package import free of file access, web3 and pyarrow
+    if name == "ExecutionClientConnector":
+        from .execution_client_connector import ExecutionClientConnector
+        return ExecutionClientConnector
+    if name == "EtherscanConnector":
+        from .etherscan_connector import EtherscanConnector
+        return EtherscanConnector
+    if name == "TokenStandard":
+        from .execution_client_connector import get_token_standard_enum
+        return get_token_standard_enum()
+    if name == "ColumnarExporter":
+        from .columnar_exporter import ColumnarExporter
+        return ColumnarExporter
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
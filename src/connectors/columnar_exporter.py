@@ -0,0 +1,235 @@
+import pyarrow as pa
+import pyarrow.parquet as pq
+from decimal import Decimal
+from typing import Union
+import os
+import logging
+from connectors.sql_database_connector import SqlDatabaseConnector
+
+
+# uint256 values need up to 78 digits, decimal256 holds at most 76 -> larger values are null in the decimal column
+# every decimal column has a lossless "<name>_raw" twin with the big-endian uint256
+DECIMAL_PRECISION = 76
+DECIMAL_MAX_VALUE = 10 ** DECIMAL_PRECISION
+UINT256_MAX_VALUE = 2 ** 256
+
+# raw column -> source column
+RAW_COLUMNS = {
+    "total_supply_raw": "total_supply",
+    "value_raw": "value"
+}
+
+TOKEN_STANDARD_COLUMNS = [
+    "ERC20",
+    "ERC20Metadata",
+    "ERC165",
+    "ERC721",
+    "ERC721Enumerable",
+    "ERC721Metadata",
+    "ERC777Token",
+    "ERC1155",
+    "ERC1155TokenReceiver"
+]
+
+ADDRESS_TYPE = pa.binary(20)
+HASH_TYPE = pa.binary(32)
+DECIMAL_TYPE = pa.decimal256(DECIMAL_PRECISION, 0)
+UINT256_TYPE = pa.binary(32)
+
+CONTRACT_SCHEMA = pa.schema(
+    [
+        ("contract_address", ADDRESS_TYPE),
+        ("name", pa.string()),
+        ("symbol", pa.string()),
+        ("block_deployed", pa.int64()),
+        ("total_supply", DECIMAL_TYPE),
+        ("total_supply_raw", UINT256_TYPE)
+    ] + [(token_standard, pa.bool_()) for token_standard in TOKEN_STANDARD_COLUMNS]
+)
+
+TRANSACTION_SCHEMA = pa.schema([
+    ("transaction_hash", HASH_TYPE),
+    ("contract_address", ADDRESS_TYPE),
+    ("token_id", pa.int64()),
+    ("value", DECIMAL_TYPE),
+    ("value_raw", UINT256_TYPE),
+    ("from_address", ADDRESS_TYPE),
+    ("to_address", ADDRESS_TYPE),
+    ("block_number", pa.int64())
+])
+
+
+def to_fixed_binary(value: Union[str, bytes, None]):
+    if value is None:
+        return None
+    if isinstance(value, (bytes, bytearray)):
+        return bytes(value)
+
+    return bytes.fromhex(value[2:] if value.startswith("0x") else value)
+
+
+def to_uint256(value: Union[str, int, bytes, Decimal, None]):
+    # varchar digits (hex schema) or big-endian binary(32) (compact schema)
+    if value is None:
+        return None
+    if isinstance(value, (bytes, bytearray)):
+        return int.from_bytes(bytes(value), "big")
+    if isinstance(value, str):
+        if not value.isdigit():
+            return None
+        return int(value)
+
+    value = int(value)
+    if value < 0 or value >= UINT256_MAX_VALUE:
+        return None
+
+    return value
+
+
+def to_uint256_bytes(value):
+    value = to_uint256(value)
+    if value is None:
+        return None
+
+    return value.to_bytes(32, "big")
+
+
+def to_bool(value):
+    if value is None:
+        return None
+
+    return True if value == 1 else False
+
+
+COLUMN_CONVERTERS = {
+    pa.binary(20): to_fixed_binary,
+    pa.binary(32): to_fixed_binary,
+    pa.bool_(): to_bool
+}
+
+
+class ColumnarExporter:
+
+    def __init__(self,
+                 sql_db_connector: SqlDatabaseConnector,
+                 output_dir: str,
+                 file_format: str = "parquet",
+                 partition_size: int = 100000,
+                 batch_size: int = 10000
+                 ) -> None:
+        if file_format not in ["parquet", "arrow"]:
+            raise ValueError(f"Unsupported file format: {file_format}")
+
+        self.sql_db_connector = sql_db_connector
+        self.output_dir = output_dir
+        self.file_format = file_format
+        self.partition_size = partition_size
+        self.batch_size = batch_size
+
+    # General Functions
+
+    def rows_to_record_batch(self, rows: list[dict], schema: pa.Schema) -> tuple:
+        # return (record batch, number of values too large for their decimal column)
+        columns = []
+        overflow_count = 0
+        for field in schema:
+            if field.name in RAW_COLUMNS:
+                values = [to_uint256_bytes(row[RAW_COLUMNS[field.name]])
+                          for row in rows]
+            elif field.type == DECIMAL_TYPE:
+                uint_values = [to_uint256(row[field.name]) for row in rows]
+                values = [Decimal(value) if value is not None and value < DECIMAL_MAX_VALUE else None
+                          for value in uint_values]
+                overflow_count += len(
+                    [value for value in uint_values if value is not None and value >= DECIMAL_MAX_VALUE])
+            else:
+                converter = COLUMN_CONVERTERS.get(field.type)
+                if converter is None:
+                    values = [row[field.name] for row in rows]
+                else:
+                    values = [converter(row[field.name]) for row in rows]
+
+            columns.append(pa.array(values, type=field.type))
+
+        return pa.RecordBatch.from_arrays(columns, schema=schema), overflow_count
+
+    def open_writer(self, file_path: str, schema: pa.Schema):
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+
+        if self.file_format == "parquet":
+            return pq.ParquetWriter(file_path, schema)
+        else:
+            return pa.ipc.new_file(file_path, schema)
+
+    def write_record_batch(self, writer, record_batch: pa.RecordBatch):
+        if self.file_format == "parquet":
+            writer.write_batch(record_batch)
+        else:
+            writer.write(record_batch)
+
+    def get_partition_path(self, table_name: str, partition_name: str) -> str:
+        return os.path.join(self.output_dir, table_name, f"block_range={partition_name}", f"part-0.{self.file_format}")
+
+    def export_partition(self, table_name: str, schema: pa.Schema, range_column: str, range_start: Union[int, None], range_end: Union[int, None], partition_name: str) -> int:
+        # writer is opened on the first batch so empty block ranges produce no files
+        writer = None
+        row_count = 0
+        overflow_count = 0
+
+        # raw columns are derived from their source column and not queried
+        fields = [name for name in schema.names if name not in RAW_COLUMNS]
+
+        try:
+            # raw db values: compact schema binaries are written as is without hex round trips
+            for rows in self.sql_db_connector.iterate_data(table_name, fields, range_column, range_start, range_end, self.batch_size, convert=False):
+                if writer is None:
+                    writer = self.open_writer(
+                        self.get_partition_path(table_name, partition_name), schema)
+
+                record_batch, batch_overflow_count = self.rows_to_record_batch(
+                    rows, schema)
+                self.write_record_batch(writer, record_batch)
+                row_count += len(rows)
+                overflow_count += batch_overflow_count
+        finally:
+            if writer is not None:
+                writer.close()
+
+        if row_count > 0:
+            logging.info(
+                f"Exported partition: {table_name}/{partition_name} -> {row_count} rows")
+        if overflow_count > 0:
+            logging.warning(
+                f"Exported partition: {table_name}/{partition_name} -> {overflow_count} values exceed decimal256, see *_raw columns")
+
+        return row_count
+
+    def export_table(self, table_name: str, schema: pa.Schema, range_column: str, block_start: int, block_end: int, with_unknown_block: bool = False) -> int:
+        row_count = 0
+
+        for partition_start in range(block_start, block_end, self.partition_size):
+            partition_end = min(partition_start + self.partition_size, block_end)
+
+            row_count += self.export_partition(
+                table_name, schema, range_column, partition_start, partition_end, f"{partition_start}-{partition_end}")
+
+        if with_unknown_block:
+            row_count += self.export_partition(
+                table_name, schema, range_column, None, None, "unknown")
+
+        return row_count
+
+    # Contract Functions
+
+    def export_contract_data(self, table_name: str, block_start: int, block_end: int, with_unknown_block: bool = True, with_abi: bool = False) -> int:
+        # contracts are partitioned by deploy block, contracts without deploy block go to the "unknown" partition
+        schema = CONTRACT_SCHEMA
+        if with_abi:
+            schema = schema.append(pa.field("abi", pa.string()))
+
+        return self.export_table(table_name, schema, "block_deployed", block_start, block_end, with_unknown_block)
+
+    # Transaction Functions
+
+    def export_transaction_data(self, table_name: str, block_start: int, block_end: int) -> int:
+        return self.export_table(table_name, TRANSACTION_SCHEMA, "block_number", block_start, block_end)
@@ -3,21 +3,69 @@ from web3.exceptions import NoABIFound
 import json
 import requests
 from enum import Enum
-from os import listdir
+from os import listdir, path
+import threading
 from connectors.sql_database_connector import SqlDatabaseConnector
 
 
 timeout = 60
 
-# init token standards
-TokenStandard = Enum("TokenStandard", [(token_standard.replace(
-    ".json", ""), token_standard.replace(
-    ".json", "")) for token_standard in listdir(f"src/token_standard") if token_standard.endswith(".json")])
+# keccak("Transfer(address,address,uint256)"), shared by ERC20 and ERC721
+TRANSFER_EVENT_TOPIC = "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
+ZERO_ADDRESS_TOPIC = "0x0000000000000000000000000000000000000000000000000000000000000000"
 
-token_standards = {}
-for token_standard in TokenStandard:
-    with open(f"src/token_standard/{token_standard.name}.json", "r") as f:
-        token_standards[token_standard.name] = json.load(f)
+# token standards are shipped next to the connectors package (src/token_standard)
+TOKEN_STANDARD_DIR = path.join(path.dirname(
+    path.dirname(path.abspath(__file__))), "token_standard")
+
+
+# token standards are loaded once on first use and cached
+# the lock keeps concurrent first uses (worker threads) from building separate TokenStandard enums
+token_standard_cache = {}
+token_standard_lock = threading.RLock()
+
+
+def get_token_standard_enum() -> Enum:
+    with token_standard_lock:
+        if "enum" not in token_standard_cache:
+            token_standard_names = sorted([token_standard.replace(".json", "") for token_standard in listdir(
+                TOKEN_STANDARD_DIR) if token_standard.endswith(".json")])
+
+            token_standard_cache["enum"] = Enum("TokenStandard", [(
+                token_standard_name, token_standard_name) for token_standard_name in token_standard_names])
+
+        return token_standard_cache["enum"]
+
+
+def load_token_standards() -> dict:
+    with token_standard_lock:
+        if "abis" not in token_standard_cache:
+            token_standards = {}
+            for token_standard in get_token_standard_enum():
+                with open(path.join(TOKEN_STANDARD_DIR, f"{token_standard.name}.json"), "r") as f:
+                    token_standards[token_standard.name] = json.load(f)
+
+            token_standard_cache["abis"] = token_standards
+
+        return token_standard_cache["abis"]
+
+
+def load_token_standard_function_names() -> dict:
+    # precompiled form used for implemented token standard checks
+    with token_standard_lock:
+        if "function_names" not in token_standard_cache:
+            token_standard_cache["function_names"] = {token_standard_name: frozenset(token_standard_function_abi["name"] for token_standard_function_abi in token_standard_abi)
+                                                      for token_standard_name, token_standard_abi in load_token_standards().items()}
+
+        return token_standard_cache["function_names"]
+
+
+def __getattr__(name: str):
+    # TokenStandard enum is built on first access instead of at import
+    if name == "TokenStandard":
+        return get_token_standard_enum()
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class ExecutionClientConnector:
@@ -31,16 +79,30 @@ class ExecutionClientConnector:
                  ) -> None:
         # execution client params
         self.execution_client_url = execution_client_url
-        self.token_standards = token_standards
         # set etherscan api params
         self.etherscan_ip = etherscan_ip
         self.etherscan_api_key = etherscan_api_key
         # set sql db connector
         self.sql_db_connector = sql_db_connector
         self.contract_table_name = contract_table_name
-        # init execution client
-        self.execution_client = Web3(Web3.HTTPProvider(
-            self.execution_client_url, request_kwargs={'timeout': timeout}))
+        # execution client is initialized on first use
+        self.web3_client = None
+        self.web3_client_lock = threading.Lock()
+
+    @property
+    def execution_client(self) -> Web3:
+        # first use may happen concurrently from prefetch/refresh worker threads
+        if self.web3_client is None:
+            with self.web3_client_lock:
+                if self.web3_client is None:
+                    self.web3_client = Web3(Web3.HTTPProvider(
+                        self.execution_client_url, request_kwargs={'timeout': timeout}))
+
+        return self.web3_client
+
+    @property
+    def token_standards(self) -> dict:
+        return load_token_standards()
 
     def get_block_number(self):
         response = self.execution_client.eth.get_block_number()
@@ -89,7 +151,7 @@ class ExecutionClientConnector:
 
         return response
 
-    def get_token_standard_abi(self, token_standard: TokenStandard):
+    def get_token_standard_abi(self, token_standard: "TokenStandard"):
         return self.token_standards[token_standard.name]
 
     def get_contract_abi(self, contract_address: str):
@@ -133,24 +195,15 @@ class ExecutionClientConnector:
         if contract_abi is None:
             contract_abi = self.get_contract_abi(contract_address)
 
-        contract_abi = [
-            contract_function_abi for contract_function_abi in contract_abi if "name" in contract_function_abi.keys()]
+        contract_function_names = set(
+            contract_function_abi["name"] for contract_function_abi in contract_abi if "name" in contract_function_abi.keys())
 
         implemented_token_standards = {}
 
-        for token_standard_name, token_standard_abi in self.token_standards.items():
-            # implemented flag
-            implemented = True
-
-            for token_standard_function_abi in token_standard_abi:
-                contract_function_filter = [
-                    contract_function for contract_function in contract_abi if contract_function["name"] == token_standard_function_abi["name"]]
-
-                if len(contract_function_filter) == 0:
-                    implemented = False
-                    break
-
-            implemented_token_standards[token_standard_name] = implemented
+        for token_standard_name, token_standard_function_names in load_token_standard_function_names().items():
+            # implemented if every token standard function name is in the contract abi
+            implemented_token_standards[token_standard_name] = token_standard_function_names.issubset(
+                contract_function_names)
 
         return implemented_token_standards
 
@@ -190,6 +243,26 @@ class ExecutionClientConnector:
             else:
                 return None
 
+    def get_mint_burn_contract_activity(self, from_block: int, to_block: int) -> dict:
+        # count Transfer mint (from zero address) and burn (to zero address) events per contract
+        mint_logs = self.execution_client.eth.get_logs({
+            "fromBlock": from_block,
+            "toBlock": to_block,
+            "topics": [TRANSFER_EVENT_TOPIC, ZERO_ADDRESS_TOPIC]
+        })
+        burn_logs = self.execution_client.eth.get_logs({
+            "fromBlock": from_block,
+            "toBlock": to_block,
+            "topics": [TRANSFER_EVENT_TOPIC, None, ZERO_ADDRESS_TOPIC]
+        })
+
+        contract_activity = {}
+        for log in mint_logs + burn_logs:
+            contract_activity[log["address"]] = contract_activity.get(
+                log["address"], 0) + 1
+
+        return contract_activity
+
     def get_contract_metadata(self, contract_address: str, contract_abi=None):
         try:
             token_name = self.execute_contract_function(
@@ -0,0 +1,110 @@
+from collections import OrderedDict
+from typing import Union
+import copy
+
+
+def copy_data(data):
+    # rows are flat dicts apart from decoded json (abi) -> only containers need a deep copy
+    if isinstance(data, dict):
+        return {key: copy.deepcopy(value) if isinstance(value, (dict, list)) else value for key, value in data.items()}
+
+    return data
+
+
+def copy_result(result):
+    # callers get their own copy so modifying a result can not change the cached one
+    if isinstance(result, list):
+        return [copy_data(data) for data in result]
+
+    return copy_data(result)
+
+
+class QueryCache:
+    """
+    LRU cache of query results bounded by the number of cached rows.
+    Every entry has a scope (table_name, contract_address, token_id):
+    - (table_name, None, None): table wide results (e.g. contract lists)
+    - (table_name, contract_address, None): results of one contract
+    - (table_name, contract_address, token_id): results of one token
+    """
+
+    def __init__(self, max_rows: int = 100000) -> None:
+        self.max_rows = max_rows
+
+        # cache key -> (scope, row count, result)
+        self.entries = OrderedDict()
+        # scope -> cache keys
+        self.scope_keys = {}
+        # (table_name, contract_address) -> scopes of the contract
+        self.contract_scopes = {}
+        self.row_count = 0
+
+    def get(self, cache_key: tuple) -> tuple:
+        # return (hit, result)
+        entry = self.entries.get(cache_key)
+        if entry is None:
+            return False, None
+
+        self.entries.move_to_end(cache_key)
+
+        return True, copy_result(entry[2])
+
+    def put(self, cache_key: tuple, scope: tuple, result):
+        row_count = len(result) if isinstance(result, list) else 1
+        # results larger than the whole cache are not cached
+        if row_count > self.max_rows:
+            return
+
+        self.remove(cache_key)
+
+        self.entries[cache_key] = (scope, row_count, copy_result(result))
+        self.scope_keys.setdefault(scope, set()).add(cache_key)
+        self.contract_scopes.setdefault(scope[:2], set()).add(scope)
+        self.row_count += row_count
+
+        while self.row_count > self.max_rows:
+            self.remove(next(iter(self.entries)))
+
+    def remove(self, cache_key: tuple):
+        entry = self.entries.pop(cache_key, None)
+        if entry is None:
+            return
+
+        scope, row_count, _ = entry
+        self.row_count -= row_count
+
+        scope_keys = self.scope_keys[scope]
+        scope_keys.discard(cache_key)
+        if len(scope_keys) == 0:
+            del self.scope_keys[scope]
+
+            contract_scopes = self.contract_scopes[scope[:2]]
+            contract_scopes.discard(scope)
+            if len(contract_scopes) == 0:
+                del self.contract_scopes[scope[:2]]
+
+    def remove_scope(self, scope: tuple):
+        for cache_key in list(self.scope_keys.get(scope, [])):
+            self.remove(cache_key)
+
+    def invalidate(self, table_name: str, contract_address: Union[str, None] = None, token_id: Union[int, None] = None):
+        # table wide results include every contract and token
+        self.remove_scope((table_name, None, None))
+
+        if contract_address is None:
+            # unknown change -> drop every result of the table
+            for scope in [scope for scope in self.scope_keys if scope[0] == table_name]:
+                self.remove_scope(scope)
+        elif token_id is None:
+            # contract change -> drop contract and token results of the contract
+            for scope in list(self.contract_scopes.get((table_name, contract_address), [])):
+                self.remove_scope(scope)
+        else:
+            self.remove_scope((table_name, contract_address, None))
+            self.remove_scope((table_name, contract_address, token_id))
+
+    def clear(self):
+        self.entries.clear()
+        self.scope_keys.clear()
+        self.contract_scopes.clear()
+        self.row_count = 0
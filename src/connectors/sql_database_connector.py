@@ -1,14 +1,34 @@
 import mysql.connector
 from mysql.connector import errorcode
 from mysql.connector.errors import DatabaseError
+from connectors.query_cache import QueryCache
 import json
 from typing import Union
 import logging
+import time
+
+
+# compact schema column groups
+ADDRESS_COLUMNS = ["contract_address", "from_address", "to_address"]
+HASH_COLUMNS = ["transaction_hash"]
+NUMERIC_COLUMNS = ["total_supply", "value"]
+
+# compact schema byte lengths: addresses binary(20), hashes and uint256 numbers binary(32) big-endian
+ADDRESS_LENGTH = 20
+HASH_LENGTH = 32
+UINT256_LENGTH = 32
+UINT256_MAX_VALUE = 2 ** 256
+
+# change log housekeeping: prune every n change writes, keep the newest n changes
+CHANGE_LOG_PRUNE_INTERVAL = 1000
+CHANGE_LOG_RETENTION = 1000000
+# readers further behind than this clear their cache instead of applying every change
+CHANGE_LOG_MAX_APPLY = 10000
 
 
 class SqlDatabaseConnector:
 
-    def __init__(self, host: str, port: int, user: str, password: str, db_name: str, tables: list = None, with_logging: bool = True) -> None:
+    def __init__(self, host: str, port: int, user: str, password: str, db_name: str, tables: list = None, with_logging: bool = True, compact_schema: bool = False, cache_max_rows: int = 100000, change_table_name: str = None, poll_changes: bool = False, cache_version_ttl: float = 5.0) -> None:
         # set logging
         if with_logging:
             logging.basicConfig(level=logging.INFO)
@@ -22,26 +42,237 @@ class SqlDatabaseConnector:
             'port': port
         }
         self.db_name = db_name
+        self.compact_schema = compact_schema
 
-        self.connection = None
-        try:
-            self.connect(self.config)
+        self.tables = tables if tables is not None else []
 
-            self.db_name = db_name
-            self.use_database(db_name)
-
-            for table in tables:
-                self.create_table(table)
-        except DatabaseError:
-            pass
+        # connection, database and tables are set up on first use
+        self.connection = None
+        self.initialized = False
+
+        # lru query result cache, invalidated per contract/token by writes
+        self.query_cache = QueryCache(cache_max_rows)
+        # opt-in: with a change table writes are logged so connectors in other processes can invalidate their cache,
+        # readers with poll_changes apply the logged changes (writers see their own writes without polling)
+        self.change_table_name = change_table_name
+        self.poll_changes = poll_changes
+        self.cache_version_ttl = cache_version_ttl
+        self.cache_change_id = None
+        self.cache_checked_at = None
+        self.change_write_counter = 0
+        self.data_types = {}
 
     def __del__(self):
         if self.connection is not None:
             self.connection.close()
 
+    # Converter Functions
+
+    def to_db_value(self, column: str, value):
+        # convert public values (hex strings, ints) into compact schema values
+        if not self.compact_schema or value is None:
+            return value
+
+        if column in ADDRESS_COLUMNS or column in HASH_COLUMNS:
+            length = ADDRESS_LENGTH if column in ADDRESS_COLUMNS else HASH_LENGTH
+
+            db_value = None
+            if isinstance(value, (bytes, bytearray)):
+                db_value = bytes(value)
+            elif isinstance(value, str):
+                try:
+                    db_value = bytes.fromhex(
+                        value[2:] if value.startswith("0x") else value)
+                except ValueError:
+                    pass
+
+            # short values would be zero padded by binary(n) -> reject instead
+            if db_value is None or len(db_value) != length:
+                raise ValueError(f"Invalid {column}: {value}")
+
+            return db_value
+
+        if column in NUMERIC_COLUMNS:
+            if isinstance(value, str) and not value.isdigit():
+                return None
+            value = int(value)
+            if value < 0 or value >= UINT256_MAX_VALUE:
+                logging.warning(
+                    f"Value out of uint256 range: {column} -> stored as NULL")
+                return None
+            # big-endian keeps the byte order equal to the numeric order
+            return value.to_bytes(UINT256_LENGTH, "big")
+
+        return value
+
+    def from_db_value(self, column: str, value):
+        # convert compact schema values back into checksummed hex strings and ints
+        if not self.compact_schema or value is None:
+            return value
+
+        if column in ADDRESS_COLUMNS:
+            # imported here so the db connector (e.g. export) does not load web3
+            from web3 import Web3
+            return Web3.to_checksum_address(f"0x{bytes(value).hex()}")
+
+        if column in HASH_COLUMNS:
+            return f"0x{bytes(value).hex()}"
+
+        if column in NUMERIC_COLUMNS and isinstance(value, (bytes, bytearray)):
+            return int.from_bytes(bytes(value), "big")
+
+        return value
+
+    def data_to_db(self, data: Union[dict, None]) -> Union[dict, None]:
+        if not self.compact_schema or data is None:
+            return data
+
+        return {key: self.to_db_value(key, value) for key, value in data.items()}
+
+    def data_from_db(self, data_list: list) -> list:
+        if not self.compact_schema:
+            return data_list
+
+        for data in data_list:
+            for key, value in data.items():
+                data[key] = self.from_db_value(key, value)
+
+        return data_list
+
+    # Cache Functions
+
+    def get_cache_address(self, contract_address):
+        # cache scopes use lowercase hex addresses
+        if contract_address is None:
+            return None
+        if isinstance(contract_address, (bytes, bytearray)):
+            return f"0x{bytes(contract_address).hex()}"
+
+        return contract_address.lower()
+
+    def record_changes(self, table_name: str, changes: set):
+        # changes: {(contract_address, token_id)}, contract_address None for unknown changes
+        for contract_address, token_id in changes:
+            self.query_cache.invalidate(
+                table_name, self.get_cache_address(contract_address), token_id)
+
+        if self.change_table_name is None or len(changes) == 0:
+            return
+
+        insert_query = f"INSERT INTO {self.change_table_name} (table_name, contract_address, token_id) VALUES (%s, %s, %s)"
+
+        cursor = self.connection.cursor()
+        cursor.executemany(insert_query, [(table_name, self.to_db_value("contract_address", contract_address), token_id)
+                                          for contract_address, token_id in changes])
+        self.connection.commit()
+
+        self.change_write_counter += 1
+        if self.change_write_counter % CHANGE_LOG_PRUNE_INTERVAL == 0:
+            cursor.execute(
+                f"SELECT MAX(change_id) FROM {self.change_table_name}")
+            max_change_id = cursor.fetchone()[0]
+            cursor.execute(f"DELETE FROM {self.change_table_name} WHERE change_id <= %s", (
+                max_change_id - CHANGE_LOG_RETENTION,))
+            self.connection.commit()
+
+        cursor.close()
+
+    def refresh_cache_version(self):
+        # apply changes logged by other connectors (e.g. the indexer) at most every cache_version_ttl seconds
+        if self.change_table_name is None or not self.poll_changes:
+            return
+        if self.cache_checked_at is not None and time.monotonic() - self.cache_checked_at < self.cache_version_ttl:
+            return
+
+        self.cache_checked_at = time.monotonic()
+        self.use_database(self.db_name)
+        # end the current read transaction, a REPEATABLE READ snapshot would never see new changes
+        self.connection.commit()
+
+        cursor = self.connection.cursor()
+        cursor.execute(
+            f"SELECT MIN(change_id), MAX(change_id) FROM {self.change_table_name}")
+        min_change_id, max_change_id = cursor.fetchone()
+
+        if max_change_id is None or self.cache_change_id is None:
+            # first check: nothing is cached yet
+            pass
+        elif min_change_id > self.cache_change_id + 1 or max_change_id - self.cache_change_id > CHANGE_LOG_MAX_APPLY:
+            # missed changes were pruned or too many changes to apply
+            self.query_cache.clear()
+        elif max_change_id > self.cache_change_id:
+            select_query = f"SELECT DISTINCT table_name, contract_address, token_id FROM {self.change_table_name} WHERE change_id > %s and change_id <= %s"
+            cursor.execute(select_query, (self.cache_change_id, max_change_id))
+            for table_name, contract_address, token_id in cursor.fetchall():
+                contract_address = self.from_db_value(
+                    "contract_address", contract_address)
+                self.query_cache.invalidate(
+                    table_name, self.get_cache_address(contract_address), token_id)
+
+        cursor.close()
+
+        if max_change_id is not None:
+            self.cache_change_id = max_change_id
+        elif self.cache_change_id is None:
+            self.cache_change_id = 0
+
+    def cached_query(self, table_name: str, cache_key: tuple, scope: tuple, query_function, cache_if=None):
+        # scope: (contract_address, token_id) of the result, (None, None) for table wide results
+        if self.query_cache.max_rows <= 0:
+            return query_function()
+
+        self.refresh_cache_version()
+
+        cache_key = (table_name,) + cache_key
+        hit, result = self.query_cache.get(cache_key)
+        if hit:
+            return result
+
+        result = query_function()
+
+        if cache_if is None or cache_if(result):
+            self.query_cache.put(
+                cache_key, (table_name, self.get_cache_address(scope[0]), scope[1]), result)
+
+        return result
+
+    def clear_cache(self):
+        self.query_cache.clear()
+
     # General Functions
 
+    def initialize(self):
+        self.initialized = True
+        try:
+            self.use_database(self.db_name)
+
+            for table in self.tables:
+                self.create_table(table)
+                self.check_table_schema(table.split(" ", 1)[0])
+        except Exception:
+            # retry setup on next use (also on connection/interface errors)
+            self.initialized = False
+            raise
+
+    def check_table_schema(self, table_name: str):
+        # existing tables are not recreated -> refuse to write compact values into a hex schema and vice versa
+        data_types = self.query_data_type(table_name)
+        for column in ADDRESS_COLUMNS + HASH_COLUMNS + NUMERIC_COLUMNS:
+            if self.compact_schema:
+                expected_data_type = "binary"
+            else:
+                expected_data_type = "varchar" if column in NUMERIC_COLUMNS else "char"
+
+            if column in data_types and data_types[column] != expected_data_type:
+                logging.error(
+                    f"Schema mismatch: {table_name}.{column} is {data_types[column]}, expected {expected_data_type}")
+                raise DatabaseError(
+                    f"Schema mismatch: {table_name}.{column} is {data_types[column]}, expected {expected_data_type}")
+
     def connect(self, config: Union[dict, None] = None):
+        if not self.initialized:
+            self.initialize()
+
         try:
             if config is not None:
                 self.connection = mysql.connector.connect(**config)
@@ -113,9 +344,36 @@ class SqlDatabaseConnector:
 
         cursor.close()
 
+    def has_index(self, table_name: str, index_name: str) -> bool:
+        self.use_database(self.db_name)
+
+        select_query = "SELECT COUNT(*) FROM INFORMATION_SCHEMA.STATISTICS WHERE TABLE_SCHEMA = %s and TABLE_NAME = %s and INDEX_NAME = %s"
+
+        cursor = self.connection.cursor()
+        cursor.execute(select_query, (self.db_name, table_name, index_name))
+        index_count = cursor.fetchone()[0]
+        cursor.close()
+
+        return index_count > 0
+
+    def create_index(self, table_name: str, index_name: str, column: str):
+        # tables created before an index was added to their description do not have it
+        if self.has_index(table_name, index_name):
+            return
+
+        cursor = self.connection.cursor()
+        cursor.execute(
+            f"ALTER TABLE {table_name} ADD INDEX {index_name} ({column})")
+        cursor.close()
+        logging.info(f"Created index: {table_name}.{index_name}")
+
     def insert_data(self, table_name: str, data: dict):
         self.use_database(self.db_name)
 
+        changes = {(data.get("contract_address"), data.get("token_id"))}
+
+        data = self.data_to_db(data)
+
         data_fields = ", ".join(data.keys())
         data_value_slots = ", ".join([f"%({key})s" for key in data.keys()])
 
@@ -126,9 +384,18 @@ class SqlDatabaseConnector:
         self.connection.commit()
         cursor.close()
 
+        self.record_changes(table_name, changes)
+
     def insert_many_data(self, table_name: str, many_data: list[dict], batch_size: int = 10000):
         self.use_database(self.db_name)
 
+        # one change per contract/token
+        changes = {(data.get("contract_address"), data.get("token_id"))
+                   for data in many_data}
+
+        if self.compact_schema:
+            many_data = [self.data_to_db(data) for data in many_data]
+
         field_names = many_data[0].keys()
         data_fields = ", ".join(field_names)
         data_value_slots = ", ".join([f"%({key})s" for key in field_names])
@@ -161,6 +428,8 @@ class SqlDatabaseConnector:
 
         cursor.close()
 
+        self.record_changes(table_name, changes)
+
     def query_data(self, table_name: str, fields: Union[list, str] = "*", equal_filter: dict = None, limit: int = 1000) -> list:
         self.use_database(self.db_name)
 
@@ -176,17 +445,58 @@ class SqlDatabaseConnector:
                 [f"{key} = %({key})s" for key in equal_filter.keys()])
             select_query = f"SELECT {data_fields} FROM {table_name} WHERE {data_filter_slots} LIMIT {limit}"
 
+        try:
+            db_filter = self.data_to_db(equal_filter)
+        except ValueError:
+            # malformed address/hash can not match any row
+            return []
+
         cursor = self.connection.cursor(dictionary=True, prepared=True)
-        cursor.execute(select_query, equal_filter)
+        cursor.execute(select_query, db_filter)
         data_list = cursor.fetchall()
         cursor.close()
 
-        return data_list
+        return self.data_from_db(data_list)
+
+    def iterate_data(self, table_name: str, fields: Union[list, str] = "*", range_column: Union[str, None] = None, range_start: Union[int, None] = None, range_end: Union[int, None] = None, batch_size: int = 10000, convert: bool = True):
+        # stream rows in batches instead of materializing the whole result set
+        # range is [range_start, range_end), both None selects rows where range_column is NULL
+        # convert=False returns raw db values (e.g. binary addresses) for bulk consumers
+        self.use_database(self.db_name)
+
+        if fields == "*":
+            data_fields = fields
+        else:
+            data_fields = ", ".join(fields)
+
+        range_filter = {}
+        if range_column is None:
+            select_query = f"SELECT {data_fields} FROM {table_name}"
+        elif range_start is None and range_end is None:
+            select_query = f"SELECT {data_fields} FROM {table_name} WHERE {range_column} IS NULL"
+        else:
+            range_filter = {"range_start": range_start, "range_end": range_end}
+            select_query = f"SELECT {data_fields} FROM {table_name} WHERE {range_column} >= %(range_start)s and {range_column} < %(range_end)s ORDER BY {range_column}"
+
+        cursor = self.connection.cursor(dictionary=True)
+        try:
+            cursor.execute(select_query, range_filter)
+            while True:
+                batch = cursor.fetchmany(batch_size)
+                if len(batch) == 0:
+                    break
+                yield self.data_from_db(batch) if convert else batch
+        finally:
+            cursor.close()
 
     def query_data_type(self, table_name: str):
+        # table schema does not change at runtime
+        if table_name in self.data_types:
+            return self.data_types[table_name]
+
         self.use_database(self.db_name)
 
-        select_query = f"SELECT COLUMN_NAME, DATA_TYPE FROM INFORMATION_SCHEMA.COLUMNS where TABLE_NAME = '{table_name}'"
+        select_query = f"SELECT COLUMN_NAME, DATA_TYPE FROM INFORMATION_SCHEMA.COLUMNS where TABLE_NAME = '{table_name}' and TABLE_SCHEMA = '{self.db_name}'"
 
         cursor = self.connection.cursor(dictionary=True, prepared=True)
         cursor.execute(select_query)
@@ -195,6 +505,8 @@ class SqlDatabaseConnector:
                           for value in data_type_list}
         cursor.close()
 
+        self.data_types[table_name] = data_type_dict
+
         return data_type_dict
 
     # Contract Functions
@@ -215,24 +527,27 @@ class SqlDatabaseConnector:
         self.insert_data(table_name, data)
 
     def query_all_contract_data(self, table_name: str, contract_address: str) -> dict:
-        data = self.query_data(table_name, equal_filter={
-                               "contract_address": contract_address})[0]
+        def query():
+            data = self.query_data(table_name, equal_filter={
+                                   "contract_address": contract_address})[0]
 
-        data_types = self.query_data_type(table_name)
+            data_types = self.query_data_type(table_name)
+
+            # convert tinyint to boolean and decode json
+            for column, data_type in data_types.items():
+                if data[column] is not None:
+                    if data_type == "tinyint":
+                        data[column] = True if data[column] == 1 else False
 
-        # convert tinyint to boolean and decode json
-        for column, data_type in data_types.items():
-            if data[column] is not None:
-                if data_type == "tinyint":
-                    data[column] = True if data[column] == 1 else False
+                    if data_type == "json":
+                        data[column] = json.loads(data[column])
 
-                if data_type == "json":
-                    data[column] = json.loads(data[column])
+                    if data_type == "varchar" and data[column].isdigit():
+                        data[column] = int(data[column])
 
-                if data_type == "varchar" and data[column].isdigit():
-                    data[column] = int(data[column])
+            return data
 
-        return data
+        return self.cached_query(table_name, ("query_all_contract_data", self.get_cache_address(contract_address)), (contract_address, None), query)
 
     def query_contract_data(self,
                             table_name: str,
@@ -255,34 +570,67 @@ class SqlDatabaseConnector:
         if with_abi:
             fields.append("abi")
 
-        if token_standard is None:
-            data = self.query_data(
-                table_name, fields, None, limit)
-        else:
-            data = self.query_data(
-                table_name, fields, {token_standard: True}, limit)
+        def query():
+            if token_standard is None:
+                data = self.query_data(
+                    table_name, fields, None, limit)
+            else:
+                data = self.query_data(
+                    table_name, fields, {token_standard: True}, limit)
 
-        data_types = self.query_data_type(table_name)
+            data_types = self.query_data_type(table_name)
+
+            for d in data:
+                for key, value in d.items():
+                    if value is not None:
+                        if data_types[key] == "json":
+                            d[key] = json.loads(value.decode("utf-8"))
 
-        for d in data:
-            for key, value in d.items():
-                if value is not None:
-                    if data_types[key] == "json":
-                        d[key] = json.loads(value.decode("utf-8"))
+                        if data_types[key] == "varchar" and value.isdigit():
+                            d[key] = int(value)
 
-                    if data_types[key] == "varchar" and value.isdigit():
-                        d[key] = int(value)
+            return data
 
-        return data
+        return self.cached_query(table_name, ("query_contract_data", token_standard, tuple(fields), limit), (None, None), query)
 
     def is_contract_in_db(self, table_name: str, contract_address: str) -> bool:
-        contract = self.query_data(table_name, equal_filter={
-                                   "contract_address": contract_address})
+        def query():
+            contract = self.query_data(table_name, equal_filter={
+                                       "contract_address": contract_address})
 
-        if len(contract) == 0:
-            return False
-        else:
-            return True
+            if len(contract) == 0:
+                return False
+            else:
+                return True
+
+        # only hits are cached, a missing contract may be inserted any time
+        return self.cached_query(table_name, ("is_contract_in_db", self.get_cache_address(contract_address)), (contract_address, None), query, cache_if=lambda contract_in_db: contract_in_db)
+
+    def query_contracts_in_db(self, table_name: str, contract_addresses: list) -> list:
+        # return the given contract addresses that are in db
+        db_contract_addresses = []
+        for contract_address in contract_addresses:
+            try:
+                db_contract_addresses.append(self.to_db_value(
+                    "contract_address", contract_address))
+            except ValueError:
+                # malformed address can not be in db
+                pass
+
+        if len(db_contract_addresses) == 0:
+            return []
+
+        self.use_database(self.db_name)
+
+        address_slots = ", ".join(["%s"] * len(db_contract_addresses))
+        select_query = f"SELECT contract_address FROM {table_name} WHERE contract_address IN ({address_slots})"
+
+        cursor = self.connection.cursor(dictionary=True)
+        cursor.execute(select_query, db_contract_addresses)
+        data_list = self.data_from_db(cursor.fetchall())
+        cursor.close()
+
+        return [data["contract_address"] for data in data_list]
 
     # Transaction Functions
 
@@ -302,7 +650,8 @@ class SqlDatabaseConnector:
     def insert_many_transaction_data(self, table_name: str, transaction_data: list[dict]):
         self.insert_many_data(table_name, transaction_data)
 
-    def query_contract_transaction_data(self, table_name: str, contract_address: str, token_id: Union[int, None] = None, fields: Union[list, str] = "*"):
+    def query_transaction_data(self, table_name: str, contract_address: str, token_id: Union[int, None] = None, fields: Union[list, str] = "*"):
+        # uncached transaction query
         filters = {
             "contract_address": contract_address
         }
@@ -316,16 +665,27 @@ class SqlDatabaseConnector:
 
         return contract_transactions
 
+    def query_contract_transaction_data(self, table_name: str, contract_address: str, token_id: Union[int, None] = None, fields: Union[list, str] = "*"):
+        def query():
+            return self.query_transaction_data(table_name, contract_address, token_id, fields)
+
+        cache_fields = fields if fields == "*" else tuple(fields)
+
+        return self.cached_query(table_name, ("query_contract_transaction_data", self.get_cache_address(contract_address), token_id, cache_fields), (contract_address, token_id), query)
+
     def query_token_transaction_data(self, table_name: str, contract_address: str, token_id: int):
         # return list of transactions sorted by block_number
         fields = ["from_address", "to_address", "block_number"]
 
-        token_transactions = self.query_contract_transaction_data(
-            table_name, contract_address, token_id, fields)
-        token_transactions = sorted(
-            token_transactions, key=lambda x: x["block_number"])
+        def query():
+            token_transactions = self.query_transaction_data(
+                table_name, contract_address, token_id, fields)
+            token_transactions = sorted(
+                token_transactions, key=lambda x: x["block_number"])
 
-        return token_transactions
+            return token_transactions
+
+        return self.cached_query(table_name, ("query_token_transaction_data", self.get_cache_address(contract_address), token_id), (contract_address, token_id), query)
 
     def is_transaction_in_db(self, table_name: str, transaction_hash: str) -> bool:
         contract = self.query_data(table_name, equal_filter={
@@ -339,9 +699,94 @@ class SqlDatabaseConnector:
     def update_contract_deploy_block(self, table_name: str, contract_address: str, block_deployed: int):
         self.use_database(self.db_name)
 
-        insert_query = f"UPDATE {table_name} SET block_deployed={block_deployed} WHERE contract_address='{contract_address}'"
+        update_query = f"UPDATE {table_name} SET block_deployed=%(block_deployed)s WHERE contract_address=%(contract_address)s"
+
+        data = self.data_to_db({
+            "block_deployed": block_deployed,
+            "contract_address": contract_address
+        })
+
+        cursor = self.connection.cursor()
+        cursor.execute(update_query, data)
+        self.connection.commit()
+        cursor.close()
+
+        self.record_changes(table_name, {(contract_address, None)})
+
+    def update_many_contract_total_supply(self, table_name: str, total_supplies: dict, batch_size: int = 1000):
+        # bulk update: one UPDATE ... CASE statement per batch of {contract_address: total_supply}
+        self.use_database(self.db_name)
+
+        total_supplies = list(total_supplies.items())
+
+        cursor = self.connection.cursor()
+        for batch_start in range(0, len(total_supplies), batch_size):
+            batch = total_supplies[batch_start:batch_start+batch_size]
+
+            case_slots = " ".join(["WHEN %s THEN %s"] * len(batch))
+            address_slots = ", ".join(["%s"] * len(batch))
+            update_query = f"UPDATE {table_name} SET total_supply = CASE contract_address {case_slots} END WHERE contract_address IN ({address_slots})"
+
+            params = []
+            for contract_address, total_supply in batch:
+                params.append(self.to_db_value(
+                    "contract_address", contract_address))
+                # varchar schema: bind as string, unquoted numbers > 65 digits turn the whole CASE into DOUBLE
+                params.append(self.to_db_value("total_supply", total_supply)
+                              if self.compact_schema else str(total_supply))
+            for contract_address, _ in batch:
+                params.append(self.to_db_value(
+                    "contract_address", contract_address))
+
+            cursor.execute(update_query, params)
+            self.connection.commit()
+
+        cursor.close()
+
+        self.record_changes(table_name, {(contract_address, None)
+                                         for contract_address, _ in total_supplies})
+
+    # Supply Refresh Functions
+
+    def insert_many_supply_refresh_activity(self, table_name: str, contract_activity: dict):
+        # add mint/burn event counts to the pending activity of each contract
+        if len(contract_activity) == 0:
+            return
+
+        self.use_database(self.db_name)
+
+        insert_query = f"INSERT INTO {table_name} (contract_address, pending_events) VALUES (%s, %s) ON DUPLICATE KEY UPDATE pending_events = pending_events + VALUES(pending_events)"
+
+        cursor = self.connection.cursor()
+        cursor.executemany(insert_query, [(self.to_db_value("contract_address", contract_address), event_count)
+                                          for contract_address, event_count in contract_activity.items()])
+        self.connection.commit()
+        cursor.close()
+
+    def query_supply_refresh_batch(self, table_name: str, limit: int) -> list:
+        self.use_database(self.db_name)
+
+        select_query = f"SELECT contract_address FROM {table_name} WHERE pending_events > 0 ORDER BY pending_events DESC LIMIT %s"
+
+        cursor = self.connection.cursor(dictionary=True)
+        cursor.execute(select_query, (limit,))
+        data_list = self.data_from_db(cursor.fetchall())
+        cursor.close()
+
+        return [data["contract_address"] for data in data_list]
+
+    def update_many_supply_refreshed(self, table_name: str, contract_addresses: list, block_number: int):
+        # reset pending activity and record the refresh block
+        if len(contract_addresses) == 0:
+            return
+
+        self.use_database(self.db_name)
+
+        address_slots = ", ".join(["%s"] * len(contract_addresses))
+        update_query = f"UPDATE {table_name} SET pending_events = 0, last_refreshed_block = %s WHERE contract_address IN ({address_slots})"
 
         cursor = self.connection.cursor()
-        cursor.execute(insert_query)
+        cursor.execute(update_query, [block_number] + [self.to_db_value(
+            "contract_address", contract_address) for contract_address in contract_addresses])
         self.connection.commit()
         cursor.close()
@@ -14,7 +14,8 @@ CONTRACT_TABLE = (
     "ERC777Token bool NOT NULL DEFAULT FALSE,"
     "ERC1155 bool NOT NULL DEFAULT FALSE,"
     "ERC1155TokenReceiver bool NOT NULL DEFAULT FALSE,"
-    "abi json DEFAULT NULL"
+    "abi json DEFAULT NULL,"
+    "INDEX block_deployed_index (block_deployed)"
     ")"
 )
 
@@ -26,6 +27,81 @@ TRANSACTION_TABLE = (
     "value varchar(100) DEFAULT NULL,"
     "from_address char(42) NOT NULL,"
     "to_address char(42) NOT NULL,"
-    "block_number int NOT NULL"
+    "block_number int NOT NULL,"
+    "INDEX block_number_index (block_number)"
+    ")"
+)
+
+# compact schema: binary addresses and hashes, supplies and values as big-endian uint256 binary(32)
+# (decimal(65,0) can not hold every uint256)
+CONTRACT_TABLE_COMPACT = (
+    "contract ("
+    "contract_address binary(20) PRIMARY KEY UNIQUE NOT NULL,"
+    "name varchar(200) DEFAULT NULL,"
+    "symbol varchar(50) DEFAULT NULL,"
+    "block_deployed int DEFAULT NULL,"
+    "total_supply binary(32) DEFAULT NULL,"
+    "ERC20 bool NOT NULL DEFAULT FALSE,"
+    "ERC20Metadata bool NOT NULL DEFAULT FALSE,"
+    "ERC165 bool NOT NULL DEFAULT FALSE,"
+    "ERC721 bool NOT NULL DEFAULT FALSE,"
+    "ERC721Enumerable bool NOT NULL DEFAULT FALSE,"
+    "ERC721Metadata bool NOT NULL DEFAULT FALSE,"
+    "ERC777Token bool NOT NULL DEFAULT FALSE,"
+    "ERC1155 bool NOT NULL DEFAULT FALSE,"
+    "ERC1155TokenReceiver bool NOT NULL DEFAULT FALSE,"
+    "abi json DEFAULT NULL,"
+    "INDEX block_deployed_index (block_deployed)"
+    ")"
+)
+
+TRANSACTION_TABLE_COMPACT = (
+    "transaction ("
+    "transaction_hash binary(32) PRIMARY KEY UNIQUE NOT NULL,"
+    "contract_address binary(20) NOT NULL,"
+    "token_id int DEFAULT NULL,"
+    "value binary(32) DEFAULT NULL,"
+    "from_address binary(20) NOT NULL,"
+    "to_address binary(20) NOT NULL,"
+    "block_number int NOT NULL,"
+    "INDEX block_number_index (block_number)"
+    ")"
+)
+
+# contracts with mint/burn events since their last total supply refresh
+SUPPLY_REFRESH_TABLE = (
+    "supply_refresh ("
+    "contract_address char(42) PRIMARY KEY UNIQUE NOT NULL,"
+    "pending_events int NOT NULL DEFAULT 0,"
+    "last_refreshed_block int DEFAULT NULL,"
+    "INDEX pending_events_index (pending_events)"
+    ")"
+)
+
+SUPPLY_REFRESH_TABLE_COMPACT = (
+    "supply_refresh ("
+    "contract_address binary(20) PRIMARY KEY UNIQUE NOT NULL,"
+    "pending_events int NOT NULL DEFAULT 0,"
+    "last_refreshed_block int DEFAULT NULL,"
+    "INDEX pending_events_index (pending_events)"
+    ")"
+)
+
+# change log of contract/token writes, read by other connectors to invalidate their query cache
+INDEX_CHANGE_TABLE = (
+    "index_change ("
+    "change_id bigint PRIMARY KEY AUTO_INCREMENT,"
+    "table_name varchar(64) NOT NULL,"
+    "contract_address char(42) DEFAULT NULL,"
+    "token_id int DEFAULT NULL"
+    ")"
+)
+
+INDEX_CHANGE_TABLE_COMPACT = (
+    "index_change ("
+    "change_id bigint PRIMARY KEY AUTO_INCREMENT,"
+    "table_name varchar(64) NOT NULL,"
+    "contract_address binary(20) DEFAULT NULL,"
+    "token_id int DEFAULT NULL"
     ")"
 )
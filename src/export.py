@@ -0,0 +1,66 @@
+from connectors import ColumnarExporter
+from sql_db_setup import create_sql_db_connector
+import config
+import argparse
+import logging
+
+logging.basicConfig(level=logging.INFO)
+
+# block range indexes used by the partition queries (see db_params/sql_tables.py)
+EXPORT_INDEXES = {
+    "contract": ("block_deployed_index", "block_deployed"),
+    "transaction": ("block_number_index", "block_number")
+}
+
+
+if __name__ == "__main__":
+    # export indexed contract and transaction data into block range partitioned columnar files
+    parser = argparse.ArgumentParser(
+        description="Export indexed contracts and transactions to Parquet/Arrow")
+    parser.add_argument("table", choices=["contract", "transaction", "all"])
+    parser.add_argument("--block-start", type=int,
+                        default=config.INDEXING_START_BLOCK)
+    parser.add_argument("--block-end", type=int,
+                        default=config.INDEXING_END_BLOCK)
+    parser.add_argument("--output-dir", default=config.EXPORT_OUTPUT_DIR)
+    parser.add_argument("--file-format", choices=["parquet", "arrow"],
+                        default=config.EXPORT_FILE_FORMAT)
+    parser.add_argument("--partition-size", type=int,
+                        default=config.EXPORT_PARTITION_SIZE)
+    parser.add_argument("--with-abi", action="store_true")
+    parser.add_argument("--create-indexes", action="store_true",
+                        help="add missing block range indexes to tables created before they were part of the schema")
+    args = parser.parse_args()
+
+    # read only tool -> no query cache
+    sql_db_connector = create_sql_db_connector(cache_max_rows=0)
+
+    table_names = {
+        "contract": config.SQL_DATABASE_TABLE_CONTRACT,
+        "transaction": config.SQL_DATABASE_TABLE_TRANSACTION
+    }
+    export_tables = ["contract", "transaction"] if args.table == "all" else [
+        args.table]
+
+    # without the block range index every partition is a full table scan
+    for export_table in export_tables:
+        index_name, column = EXPORT_INDEXES[export_table]
+        if args.create_indexes:
+            sql_db_connector.create_index(
+                table_names[export_table], index_name, column)
+        elif not sql_db_connector.has_index(table_names[export_table], index_name):
+            logging.warning(
+                f"Missing index: {table_names[export_table]}.{index_name} -> every partition scans the full table, run with --create-indexes")
+
+    columnar_exporter = ColumnarExporter(
+        sql_db_connector, args.output_dir, args.file_format, args.partition_size)
+
+    if "contract" in export_tables:
+        row_count = columnar_exporter.export_contract_data(
+            config.SQL_DATABASE_TABLE_CONTRACT, args.block_start, args.block_end, with_abi=args.with_abi)
+        logging.info(f"Contracts exported: {row_count} rows")
+
+    if "transaction" in export_tables:
+        row_count = columnar_exporter.export_transaction_data(
+            config.SQL_DATABASE_TABLE_TRANSACTION, args.block_start, args.block_end)
+        logging.info(f"Transactions exported: {row_count} rows")
@@ -1,6 +1,8 @@
-from connectors import SqlDatabaseConnector, ExecutionClientConnector, EtherscanConnector
+from connectors import ExecutionClientConnector, EtherscanConnector
 import config
-import db_params.sql_tables as tables
+from sql_db_setup import create_sql_db_connector
+from block_prefetcher import BlockPrefetcher
+from supply_refresh_scheduler import SupplyRefreshScheduler
 from web3.exceptions import NoABIFound
 from mysql.connector.errors import DatabaseError
 import logging
@@ -8,14 +10,7 @@ import logging
 logging.basicConfig(level=logging.INFO)
 
 # init sql database connector
-sql_db_connector = SqlDatabaseConnector(
-    config.SQL_DATABASE_HOST,
-    config.SQL_DATABASE_PORT,
-    config.SQL_DATABASE_USER,
-    config.SQL_DATABASE_PASSWORD,
-    config.SQL_DATABASE_NAME,
-    [tables.CONTRACT_TABLE, tables.TRANSACTION_TABLE]
-)
+sql_db_connector = create_sql_db_connector()
 
 # init execution client
 execution_client_url = f"http://{config.EXECUTION_CLIENT_IP}:{config.EXECUTION_CLIENT_PORT}"
@@ -32,6 +27,10 @@ infura_execution_client = ExecutionClientConnector(
 etherscan_connector = EtherscanConnector(
     config.ETHERSCAN_URL, config.ETHERSCAN_API_KEY)
 
+# init total supply refresh scheduler
+supply_refresh_scheduler = SupplyRefreshScheduler(
+    infura_execution_client, sql_db_connector, config.SQL_DATABASE_TABLE_CONTRACT, config.SQL_DATABASE_TABLE_SUPPLY_REFRESH, config.SUPPLY_REFRESH_BATCH_SIZE)
+
 
 def process_contract(contract_address: str) -> bool:
     # check if contract is already in db
@@ -75,9 +74,10 @@ def process_contract(contract_address: str) -> bool:
         return False
 
 
-def process_block(block_identifier: int) -> int:
-    # get block and block transactions
-    block = execution_client.get_block(block_identifier, True)
+def process_block(block_identifier: int, block: dict = None) -> int:
+    # get block (if not prefetched) and block transactions
+    if block is None:
+        block = execution_client.get_block(block_identifier, True)
     block_transactions = [
         transaction for transaction in block["transactions"] if transaction["input"] != "0x"]
     # get unique contract addresses from block
@@ -95,6 +95,9 @@ def process_block(block_identifier: int) -> int:
 
 
 if __name__ == "__main__":
+    # connect and check the table schema before indexing
+    sql_db_connector.initialize()
+
     # create file if it not exists
     f = open("src/process_data/processed_blocks.txt", "a+")
     f.close()
@@ -110,17 +113,38 @@ if __name__ == "__main__":
 
     block_count = len(block_identifiers)
 
+    # fetch upcoming blocks in the background while contracts are processed
+    block_prefetcher = BlockPrefetcher(
+        execution_client, block_identifiers, config.BLOCK_PREFETCH_WINDOW, config.BLOCK_PREFETCH_MAX_BUFFERED_BYTES)
+
     # iterate over unindexed blocks
-    for block_idx, block_identifier in enumerate(block_identifiers):
+    for block_idx, (block_identifier, block_future) in enumerate(block_prefetcher):
         try:
             # process block
-            process_result = process_block(block_identifier)
+            process_result = process_block(
+                block_identifier, block_future.result())
 
             with open("src/process_data/processed_blocks.txt", "a") as f:
                 f.write(f"{block_identifier}\n")
 
             logging.info(
                 f"Block processed: {block_identifier} [{block_idx+1}/{block_count}] -> {process_result} contracts inserted")
+
+            # only processed blocks are tracked for total supply refresh
+            supply_refresh_scheduler.add_block(block_identifier)
         except Exception as e:
             logging.error(
                 f"Block processing error: {block_identifier} -> Unknown error")
+
+        # track mint/burn activity of the processed blocks in range queries of at most SUPPLY_REFRESH_INTERVAL blocks
+        # and refresh total supply of the most active contracts
+        if (block_idx+1) % config.SUPPLY_REFRESH_INTERVAL == 0 or block_idx+1 == block_count:
+            try:
+                supply_refresh_scheduler.record_pending_blocks(
+                    config.SUPPLY_REFRESH_INTERVAL)
+
+                supply_refresh_scheduler.refresh(
+                    block_identifier, config.SUPPLY_REFRESH_MAX_BATCHES)
+            except Exception as e:
+                logging.error(
+                    f"Total supply refresh error: {block_identifier} -> Unknown error")
@@ -0,0 +1,36 @@
+from connectors import SqlDatabaseConnector
+import config
+import db_params.sql_tables as tables
+
+
+def get_sql_tables() -> list:
+    if config.SQL_DATABASE_COMPACT_SCHEMA:
+        sql_tables = [tables.CONTRACT_TABLE_COMPACT, tables.TRANSACTION_TABLE_COMPACT,
+                      tables.SUPPLY_REFRESH_TABLE_COMPACT]
+        if config.SQL_DATABASE_CHANGE_LOG:
+            sql_tables.append(tables.INDEX_CHANGE_TABLE_COMPACT)
+    else:
+        sql_tables = [tables.CONTRACT_TABLE, tables.TRANSACTION_TABLE,
+                      tables.SUPPLY_REFRESH_TABLE]
+        if config.SQL_DATABASE_CHANGE_LOG:
+            sql_tables.append(tables.INDEX_CHANGE_TABLE)
+
+    return sql_tables
+
+
+def create_sql_db_connector(cache_max_rows: int = config.SQL_DATABASE_QUERY_CACHE_MAX_ROWS, poll_changes: bool = False) -> SqlDatabaseConnector:
+    # shared by the indexer and tooling (export), connects on first use
+    # the indexer only writes the change log (if enabled), readers of other processes poll it
+    return SqlDatabaseConnector(
+        config.SQL_DATABASE_HOST,
+        config.SQL_DATABASE_PORT,
+        config.SQL_DATABASE_USER,
+        config.SQL_DATABASE_PASSWORD,
+        config.SQL_DATABASE_NAME,
+        get_sql_tables(),
+        compact_schema=config.SQL_DATABASE_COMPACT_SCHEMA,
+        cache_max_rows=cache_max_rows,
+        change_table_name=config.SQL_DATABASE_TABLE_INDEX_CHANGE if config.SQL_DATABASE_CHANGE_LOG else None,
+        poll_changes=poll_changes,
+        cache_version_ttl=config.SQL_DATABASE_QUERY_CACHE_VERSION_TTL
+    )
@@ -0,0 +1,126 @@
+from concurrent.futures import ThreadPoolExecutor
+import logging
+from connectors import ExecutionClientConnector, SqlDatabaseConnector
+
+
+class SupplyRefreshScheduler:
+
+    def __init__(self,
+                 execution_client: ExecutionClientConnector,
+                 sql_db_connector: SqlDatabaseConnector,
+                 contract_table_name: str,
+                 supply_refresh_table_name: str,
+                 batch_size: int = 100,
+                 max_workers: int = 8,
+                 max_pending_blocks: int = 10000
+                 ) -> None:
+        self.execution_client = execution_client
+        self.sql_db_connector = sql_db_connector
+        self.contract_table_name = contract_table_name
+        # pending mint/burn activity and last refresh block are persisted per contract
+        self.supply_refresh_table_name = supply_refresh_table_name
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+
+        # processed blocks whose mint/burn activity is not yet recorded
+        self.pending_blocks = set()
+        self.max_pending_blocks = max_pending_blocks
+
+    def add_block(self, block_number: int):
+        self.pending_blocks.add(block_number)
+
+    def get_block_ranges(self, max_range_size: int) -> list:
+        # contiguous runs of pending blocks split into (from_block, to_block) ranges of at most max_range_size blocks
+        # skipped or failed blocks split the runs, so no block is counted twice
+        block_ranges = []
+        for block_number in sorted(self.pending_blocks):
+            if len(block_ranges) > 0:
+                from_block, to_block = block_ranges[-1]
+                if block_number == to_block + 1 and block_number - from_block < max_range_size:
+                    block_ranges[-1] = (from_block, block_number)
+                    continue
+
+            block_ranges.append((block_number, block_number))
+
+        return block_ranges
+
+    def record_pending_blocks(self, max_range_size: int) -> int:
+        # record ranges one by one, failed ranges stay pending and are retried with the next call
+        recorded_block_counter = 0
+        for from_block, to_block in self.get_block_ranges(max_range_size):
+            try:
+                self.record_block_range(from_block, to_block)
+            except Exception as e:
+                logging.error(
+                    f"Mint/burn activity error: {from_block}-{to_block} -> Unknown error")
+                continue
+
+            self.pending_blocks.difference_update(
+                range(from_block, to_block + 1))
+            recorded_block_counter += to_block - from_block + 1
+
+        # bound the retries, oldest blocks are given up first
+        if len(self.pending_blocks) > self.max_pending_blocks:
+            pending_blocks = sorted(self.pending_blocks)
+            dropped_blocks = pending_blocks[:-self.max_pending_blocks]
+            self.pending_blocks = set(
+                pending_blocks[-self.max_pending_blocks:])
+            logging.error(
+                f"Mint/burn activity dropped: {len(dropped_blocks)} blocks ({dropped_blocks[0]}-{dropped_blocks[-1]}) -> too many unrecorded blocks")
+
+        return recorded_block_counter
+
+    def record_block_range(self, from_block: int, to_block: int):
+        # log addresses are checksummed, db addresses are compared case insensitive
+        contract_activity = {contract_address.lower(): event_count for contract_address, event_count in self.execution_client.get_mint_burn_contract_activity(
+            from_block, to_block).items()}
+
+        # only contracts already indexed are tracked, new contracts get their total supply at insert
+        contract_addresses = self.sql_db_connector.query_contracts_in_db(
+            self.contract_table_name, list(contract_activity.keys()))
+
+        self.sql_db_connector.insert_many_supply_refresh_activity(self.supply_refresh_table_name, {
+            contract_address: contract_activity[contract_address.lower()] for contract_address in contract_addresses if contract_address.lower() in contract_activity})
+
+    def query_total_supply(self, contract_address: str):
+        # totalSupply() has the same signature for all token standards -> ERC20 abi is sufficient
+        try:
+            return self.execution_client.execute_contract_function(
+                contract_address, "totalSupply", self.execution_client.token_standards["ERC20"])
+        except:
+            return None
+
+    def refresh_batch(self, contract_addresses: list, block_number: int) -> int:
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            contract_total_supplies = executor.map(
+                self.query_total_supply, contract_addresses)
+
+            total_supplies = {contract_address: total_supply for contract_address, total_supply in zip(
+                contract_addresses, contract_total_supplies) if total_supply is not None}
+
+        if len(total_supplies) > 0:
+            self.sql_db_connector.update_many_contract_total_supply(
+                self.contract_table_name, total_supplies)
+
+        # contracts are refreshed (or dropped on failed calls) once picked, new events will schedule them again
+        self.sql_db_connector.update_many_supply_refreshed(
+            self.supply_refresh_table_name, contract_addresses, block_number)
+
+        logging.info(
+            f"Total supply refreshed: {len(total_supplies)}/{len(contract_addresses)} contracts")
+
+        return len(total_supplies)
+
+    def refresh(self, block_number: int, max_batches: int = 1) -> int:
+        refreshed_contract_counter = 0
+        for _ in range(max_batches):
+            # most active contracts first
+            contract_addresses = self.sql_db_connector.query_supply_refresh_batch(
+                self.supply_refresh_table_name, self.batch_size)
+            if len(contract_addresses) == 0:
+                break
+
+            refreshed_contract_counter += self.refresh_batch(
+                contract_addresses, block_number)
+
+        return refreshed_contract_counter